@@ -4,30 +4,52 @@ FM Radio Station - Desktop internet radio player.
 Requires VLC media player to be installed: https://www.videolan.org/vlc/
 """
 
+import _tkinter
+import bisect
+import http.client
 import json
 import os
+import queue
 import random
+import shutil
+import socket
+import string
 import sys
 import threading
+import time
 import tkinter as tk
+import traceback
+import types
+from collections import ChainMap, OrderedDict
+from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
-from tkinter import ttk, messagebox
+from tkinter import ttk
 from urllib.request import Request, urlopen
 
+# Optional: orjson parses/serializes stations.json much faster; stdlib json is the fallback
 try:
-    import vlc  # type: ignore[import-untyped]
+    import orjson  # type: ignore[import-not-found]
 except ImportError:
-    vlc = None
+    orjson = None
 
 # Paths (when frozen by PyInstaller, use exe directory so stations.json lives next to exe)
 if getattr(sys, "frozen", False):
-    APP_DIR = Path(sys.executable).resolve().parent
+    APP_DIR = Path(os.path.abspath(sys.executable)).parent
 else:
-    APP_DIR = Path(__file__).resolve().parent
+    # abspath is a pure string operation; resolve() would walk every component for symlinks
+    APP_DIR = Path(os.path.abspath(__file__)).parent
 STATIONS_FILE = APP_DIR / "stations.json"
 RECORDINGS_DIR = APP_DIR / "Recordings"
-RECORD_CHUNK_SIZE = 8192
+RECORD_CHUNK_SIZE = 65536
+_SAVE_LOCK = threading.Lock()  # serializes background writes of stations.json
+# Last known on-disk state of stations.json, refreshed by load_stations and save_stations
+_STATIONS_CACHE = {"mtime": None, "data": None, "raw": None}
+MEDIA_CACHE_SIZE = 64
+
+# Recording file names: anything outside this set becomes "_" (one str.translate pass)
+_SAFE_CHARS = set(string.ascii_letters + string.digits + " .-_")
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in map(chr, range(256)) if c not in _SAFE_CHARS})
 
 # Subtle, muted theme (no neon)
 BG_DARK = "#1a1d24"
@@ -47,64 +69,152 @@ BORDER_ACCENT = "#5b7c85"
 
 
 def load_stations():
-    """Load station list from JSON."""
+    """Load station list from JSON (re-parsed only when the file's mtime changes).
+
+    A missing file gives an empty list; a file that exists but can't be read or parsed raises,
+    so the caller can refuse to save over it.
+    """
     # When frozen, copy bundled stations.json to exe dir if missing (first run)
     if getattr(sys, "frozen", False) and not STATIONS_FILE.exists():
         bundled = Path(sys._MEIPASS) / "stations.json"
         if bundled.exists():
             try:
-                import shutil
                 shutil.copy2(bundled, STATIONS_FILE)
             except OSError:
                 pass
     if not STATIONS_FILE.exists():
         return []
-    try:
-        with open(STATIONS_FILE, encoding="utf-8") as f:
-            data = json.load(f)
-        raw = data.get("stations", [])
-        defaults = default_station_metadata()
-        out = []
-        for i, s in enumerate(raw):
-            merged = {**defaults, **s}
-            if merged.get("dialPosition", 0) == 0:
-                merged["dialPosition"] = i + 1
-            out.append(merged)
-        return out
-    except (json.JSONDecodeError, OSError):
-        return []
+    mtime = STATIONS_FILE.stat().st_mtime_ns
+    if mtime == _STATIONS_CACHE["mtime"]:
+        return list(_STATIONS_CACHE["data"])
+    blob = STATIONS_FILE.read_bytes()
+    data = _json_loads(blob)
+    out = []
+    for i, s in enumerate(data.get("stations", [])):
+        # Thin view over the shared defaults instead of copying ~25 keys per station;
+        # writes land in the station's own dict
+        merged = ChainMap(s, _DEFAULTS)
+        if merged.get("dialPosition", 0) == 0:
+            merged["dialPosition"] = i + 1
+        index_station(merged)
+        out.append(merged)
+    _STATIONS_CACHE.update(mtime=mtime, data=out, raw=blob)
+    return list(out)
 
 
 def save_stations(stations):
-    """Save station list to JSON."""
-    with open(STATIONS_FILE, "w", encoding="utf-8") as f:
-        json.dump({"stations": stations}, f, indent=2)
+    """Save station list to JSON (runtime-only "_" keys are not written).
+
+    Writes a temp file and renames it over stations.json, so a crash mid-write never
+    leaves a truncated file. Skipped when the file already holds exactly this content.
+    Safe to call from a background thread.
+    """
+    clean = [{k: v for k, v in s.items() if not k.startswith("_")} for s in stations]
+    payload = _json_dumps({"stations": clean})
+    with _SAVE_LOCK:
+        try:
+            unchanged = (
+                payload == _STATIONS_CACHE["raw"]
+                and STATIONS_FILE.stat().st_mtime_ns == _STATIONS_CACHE["mtime"]
+            )
+        except OSError:
+            unchanged = False
+        if unchanged:
+            return
+        tmp = STATIONS_FILE.with_suffix(".json.tmp")
+        with open(tmp, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, STATIONS_FILE)
+        # What we just wrote is what the next load would parse
+        _STATIONS_CACHE.update(mtime=STATIONS_FILE.stat().st_mtime_ns, data=list(stations), raw=payload)
+
+
+def _json_loads(data):
+    """Parse JSON bytes (orjson when available; its errors subclass json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    """Serialize obj to 2-space indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=_json_default)
+    return json.dumps(obj, indent=2, default=_json_default).encode("utf-8")
+
+
+def _json_default(o):
+    """Serialize the read-only mappings used for shared default metadata."""
+    if isinstance(o, Mapping):
+        return dict(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def _msg(kind, *args, **kwargs):
+    """Show a tkinter.messagebox dialog; the module is only imported once a dialog is needed."""
+    from tkinter import messagebox
+    return getattr(messagebox, kind)(*args, **kwargs)
+
+
+def index_station(s):
+    """Cache the station's search blob and list row text on it (call after edits)."""
+    loc = s.get("location") or {}
+    if not isinstance(loc, Mapping):
+        loc = {}
+    # Newline-joined so a query never matches across two fields
+    s["_search_blob"] = "\n".join(filter(None, [
+        s.get("name") or "",
+        str(s.get("frequency", "")),
+        s.get("genre") or "",
+        s.get("description") or "",
+        *(t for t in s.get("tags") or [] if t),
+        loc.get("city") or "",
+        loc.get("state") or "",
+    ])).lower()
+    s["_row"] = station_row(s)
+
+
+def station_row(s):
+    """Text of the station's row in the station list."""
+    return f"  {s.get('frequency', '??')}  {s.get('name', 'Unknown')}"
+
+
+# Nested defaults are shared by every station that doesn't override them, so they're read-only
+_DEFAULT_LOCATION = types.MappingProxyType({"city": "", "state": "", "country": "US"})
+_DEFAULT_SOCIALS = types.MappingProxyType({"twitter": "", "instagram": ""})
+_DEFAULT_TAGS = ()
+_DEFAULT_FALLBACK_URLS = ()
 
 
 def default_station_metadata():
-    """Return default values for enhanced station metadata (for new stations)."""
+    """Return default values for enhanced station metadata (for new stations).
+
+    Nested containers are shared read-only singletons; replace them rather than mutate.
+    """
     return {
         "genre": "",
         "format": "streaming",
-        "location": {"city": "", "state": "", "country": "US"},
+        "location": _DEFAULT_LOCATION,
         "language": "en",
         "bitrate": None,
         "codec": "",
         "logo": "",
         "description": "",
-        "tags": [],
+        "tags": _DEFAULT_TAGS,
         "favorite": False,
         "lastPlayed": None,
         "popularity": None,
         "streamType": "icecast",
         "isLive": True,
-        "fallbackUrls": [],
+        "fallbackUrls": _DEFAULT_FALLBACK_URLS,
         "status": "unknown",
         "latencyMs": None,
         "nowPlaying": None,
         "scheduleUrl": "",
         "website": "",
-        "socials": {"twitter": "", "instagram": ""},
+        "socials": _DEFAULT_SOCIALS,
         "dialPosition": 0,
         "band": "FM",
         "hdChannel": "",
@@ -112,6 +222,10 @@ def default_station_metadata():
     }
 
 
+# Shared fallback for every station (see load_stations); read-only all the way down
+_DEFAULTS = types.MappingProxyType(default_station_metadata())
+
+
 class FMRadioApp:
     def __init__(self):
         self.root = tk.Tk()
@@ -119,36 +233,77 @@ class FMRadioApp:
         self.root.geometry("440x560")
         self.root.resizable(True, True)
         self.root.configure(bg=BG_DARK)
-
-        self.stations = load_stations()
-        self.filtered_indices = list(range(len(self.stations)))
+        # With a non-threaded Tcl, mainloop polls and sleeps this long between empty
+        # polls (default 20 ms), which adds straight to input latency
+        if not self.root.tk.getboolean(self.root.tk.call("info", "exists", "tcl_platform(threaded)")):
+            _tkinter.setbusywaitinterval(5)
+        # Set once the root window is destroyed; callbacks check it instead of winfo_exists()
+        self._destroyed = False
+        # Paint the window before importing python-vlc (a large ctypes binding that loads libvlc)
+        self.root.update()
+        try:
+            import vlc  # type: ignore[import-untyped]
+            self.vlc = vlc
+        except ImportError:
+            self.vlc = None
+
+        # Stations are parsed in a background thread so the first frame isn't blocked (see _load_stations_bg)
+        self.stations = []
+        # Column views of self.stations for the search/list hot paths (see _rebuild_columns)
+        self.col_blobs = []
+        self.col_rows = []
+        # Station indices currently shown in the listbox, in order; None forces a full refill
+        self._displayed_indices = []
+        self._stations_loaded = False
+        self._stations_error = None  # message if stations.json could not be read
+        # (stations, error) from _load_stations_bg, picked up on the Tk thread by _poll_stations_loaded
+        self._stations_result = queue.Queue(maxsize=1)
+        self.filtered_indices = []
+        # station index -> position in filtered_indices (kept in sync by _fill_listbox)
+        self._filtered_pos = {}
         self.current_index = 0
         self.player = None
         self.instance = None
+        self._is_playing = False  # set when play/pause/stop is queued; cleared if the stream dies
+        # Bumped by every _play_url; the player records the one whose media it has loaded, so
+        # end/error events from a stream that has since been replaced can be told apart
+        self._play_gen = 0
+        self._loaded_gen = 0  # written on the VLC thread
+        self._media_cache = OrderedDict()  # url -> vlc.Media, least recently used first (VLC thread only)
+        # libVLC calls can block (network probe, demuxer teardown); they run on _vlc_worker
+        self._vlc_queue = queue.Queue()
+        self._vlc_thread = None
+        # Holds at most the newest unsaved snapshot of self.stations (see _schedule_save)
+        self._save_queue = queue.Queue(maxsize=1)
+        self._save_thread = None
         self._volume = 80
+        self._vol_after_id = None
+        self._applied_volume = None  # last volume pushed to the player
         self._recording = False
         self._recording_stop = threading.Event()
         self._recording_thread = None
         self._recording_path = None
+        self._recording_sock = None  # socket of the active recording, shut down to interrupt a read
         self._filling_listbox = False
+        self._last_listbox_sel = None  # listbox row last selected by us; skips redundant Tcl calls
+        self._search_after_id = None
+        # id(station dict) -> formatted display texts; drop an entry whenever that station changes
+        self._display_cache = {}
+        self._widget_opts = {}  # widget -> options last applied via _configure
+        self._var_text = {}  # StringVar name -> text last set via _set_text
         RECORDINGS_DIR.mkdir(exist_ok=True)
 
-        if vlc is None:
+        if self.vlc is None:
             self._show_vlc_error()
             return
-
-        try:
-            self.instance = vlc.Instance("--no-xlib" if os.name != "nt" else "")
-            self.player = self.instance.media_player_new()
-        except Exception as e:
-            messagebox.showerror("VLC Error", f"Could not start VLC.\n\n{e}\n\nMake sure VLC is installed.")
-            self.root.destroy()
-            return
+        # libVLC itself (plugin scan, audio device probe) starts on first play: see _ensure_player
 
         self._build_ui()
         self._apply_styles()
-        if self.stations:
-            self._update_display()
+        threading.Thread(target=self._load_stations_bg, daemon=True).start()
+        self.root.after(20, self._poll_stations_loaded)
+        self._save_thread = threading.Thread(target=self._save_worker, daemon=True)
+        self._save_thread.start()
 
         self.root.bind_all("<Up>", self._on_up_key)
         self.root.bind_all("<Down>", self._on_down_key)
@@ -158,14 +313,130 @@ class FMRadioApp:
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
         self.root.focus_set()
 
+    def _load_stations_bg(self):
+        """Background thread: parse stations.json and queue the result for the Tk thread.
+
+        Never touches Tk itself (mainloop may not be running yet), and always queues a result,
+        so a malformed file is reported instead of leaving the app stuck in the loading state.
+        """
+        stations, error = [], None
+        try:
+            stations = load_stations()
+        except Exception as e:
+            traceback.print_exc()
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            self._stations_result.put((stations, error))
+
+    def _poll_stations_loaded(self):
+        if self._destroyed:
+            return
+        try:
+            stations, error = self._stations_result.get_nowait()
+        except queue.Empty:
+            self.root.after(20, self._poll_stations_loaded)
+            return
+        self._on_stations_loaded(stations, error)
+
+    def _on_stations_loaded(self, stations, error=None):
+        if self._destroyed:
+            return
+        if error is not None:
+            # Keep editing disabled so a save can't overwrite the file the user needs to fix
+            self._stations_error = error
+            _msg("showerror", "Stations", f"Could not read {STATIONS_FILE.name}.\n\n{error}")
+            return
+        self.stations = stations
+        self._stations_loaded = True
+        self._rebuild_columns()
+        self._fill_listbox()
+        if self.stations:
+            self._update_display()
+
+    def _ensure_player(self):
+        """Create the VLC instance, player and worker thread on first use. Returns False on failure."""
+        if self.player is not None:
+            return True
+        try:
+            self.instance = self.vlc.Instance("--no-xlib" if os.name != "nt" else "")
+            self.player = self.instance.media_player_new()
+        except Exception as e:
+            self.instance = self.player = None
+            _msg("showerror", "VLC Error", f"Could not start VLC.\n\n{e}\n\nMake sure VLC is installed.")
+            return False
+        # Play/pause/stop update _is_playing as they are queued, so the flag matches the button
+        # even while a stream is still buffering. libVLC events only report a stream that ends
+        # or fails on its own (Playing/Paused/Stopped would lag behind and undo queued commands).
+        events = self.player.event_manager()
+        event_type = self.vlc.EventType
+        for ended in (event_type.MediaPlayerEndReached, event_type.MediaPlayerEncounteredError):
+            events.event_attach(ended, self._on_vlc_ended)
+        self._vlc_thread = threading.Thread(target=self._vlc_worker, daemon=True)
+        self._vlc_thread.start()
+        return True
+
+    def _on_vlc_ended(self, event):
+        """libVLC event callback (runs on a VLC thread): the stream stopped without a user action."""
+        gen = self._loaded_gen
+        if not self._destroyed:
+            self.root.after(0, lambda: self._on_playback_ended(gen))
+
+    def _on_playback_ended(self, gen):
+        if self._destroyed or gen != self._play_gen:
+            return  # the stream that ended has already been replaced by a newer play
+        self._is_playing = False
+        self.play_btn.config(text="▶ PLAY")
+
+    def _vlc_worker(self):
+        """Background thread: run queued libVLC calls in order, off the Tk thread."""
+        while True:
+            fn = self._vlc_queue.get()
+            if fn is None:
+                return
+            try:
+                fn()
+            except Exception:
+                traceback.print_exc()
+
+    def _vlc_call(self, fn):
+        """Queue fn for the VLC thread. UI updates from fn must go through root.after."""
+        self._vlc_queue.put(fn)
+
+    def _save_worker(self):
+        """Background thread: write queued station snapshots to stations.json."""
+        while True:
+            snapshot = self._save_queue.get()
+            if snapshot is None:
+                return
+            try:
+                save_stations(snapshot)
+            except Exception:
+                # Log and keep the writer alive so later snapshots still get saved
+                traceback.print_exc()
+
+    def _schedule_save(self):
+        """Queue a snapshot of self.stations for saving, replacing any snapshot not yet written."""
+        snapshot = list(self.stations)
+        while True:
+            try:
+                self._save_queue.put_nowait(snapshot)
+                return
+            except queue.Full:
+                try:
+                    self._save_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
     def _show_vlc_error(self):
-        messagebox.showerror(
+        _msg(
+            "showerror",
             "Missing dependency",
             "python-vlc is required.\n\n"
             "Install with: pip install python-vlc\n\n"
             "You also need VLC media player installed:\n"
             "https://www.videolan.org/vlc/"
         )
+        self._destroyed = True
         self.root.destroy()
 
     def _build_ui(self):
@@ -182,11 +453,12 @@ class FMRadioApp:
         title.pack(anchor=tk.W)
         tk.Frame(header, height=1, bg=BORDER_ACCENT).pack(fill=tk.X, pady=(6, 0))
 
-        # Display panel — LED-style screen
-        display_outer = tk.Frame(main, bg=BORDER_ACCENT, padx=1, pady=1)
-        display_outer.pack(fill=tk.X, pady=(0, 14))
-        display_inner = tk.Frame(display_outer, bg=BG_DISPLAY, padx=20, pady=16)
-        display_inner.pack(fill=tk.X)
+        # Display panel — LED-style screen (1px accent border drawn by the frame's highlight ring)
+        display_inner = tk.Frame(
+            main, bg=BG_DISPLAY, padx=20, pady=16,
+            highlightthickness=1, highlightbackground=BORDER_ACCENT, highlightcolor=BORDER_ACCENT
+        )
+        display_inner.pack(fill=tk.X, pady=(0, 14))
 
         # Now Playing (compact, fixed height — single line, no resize)
         now_playing_frame = tk.Frame(display_inner, bg=BG_DISPLAY)
@@ -196,14 +468,17 @@ class FMRadioApp:
             fg=TEXT_DIM, bg=BG_DISPLAY
         ).pack(anchor=tk.W)
         # Single-line only: fixed height + no wrap so section never resizes
+        # Display texts live in StringVars; update them through _set_text
+        self.now_playing_var = tk.StringVar(value="")
         self.now_playing_label = tk.Label(
-            display_inner, text="", font=("Segoe UI", 10),
+            display_inner, textvariable=self.now_playing_var, font=("Segoe UI", 10),
             fg=GLOW, bg=BG_DISPLAY, height=1, anchor=tk.W, wraplength=0
         )
         self.now_playing_label.pack(anchor=tk.W)
 
+        self.freq_var = tk.StringVar(value="98.5")
         self.freq_label = tk.Label(
-            display_inner, text="98.5", font=("Consolas", 36, "bold"),
+            display_inner, textvariable=self.freq_var, font=("Consolas", 36, "bold"),
             fg=ACCENT, bg=BG_DISPLAY
         )
         self.freq_label.pack(anchor=tk.W)
@@ -213,8 +488,9 @@ class FMRadioApp:
         )
         self.mhz_label.place(in_=self.freq_label, relx=1.0, x=6, rely=0.55)
 
+        self.station_var = tk.StringVar(value="— No station —")
         self.station_label = tk.Label(
-            display_inner, text="— No station —", font=("Segoe UI", 11),
+            display_inner, textvariable=self.station_var, font=("Segoe UI", 11),
             fg=TEXT_DIM, bg=BG_DISPLAY, height=1, anchor=tk.W, wraplength=0
         )
         self.station_label.pack(anchor=tk.W)
@@ -229,40 +505,31 @@ class FMRadioApp:
             ("NEXT ▶", self._next_station),
             ("🎲 RANDOM", self._random_station),
         ]:
-            btn = tk.Button(
-                tune_frame, text=label, font=("Consolas", 10, "bold"),
-                bg=BG_PANEL, fg=TEXT, activebackground=BORDER_ACCENT, activeforeground=BG_DARK,
-                relief=tk.FLAT, bd=0, highlightthickness=1, highlightbackground=BORDER,
-                padx=14, pady=8, cursor="hand2", command=cmd
-            )
-            btn.pack(side=tk.LEFT, padx=4)
+            ttk.Button(
+                tune_frame, text=label, style="Nav.TButton", cursor="hand2", command=cmd
+            ).pack(side=tk.LEFT, padx=4)
         play_frame = tk.Frame(controls, bg=BG_DARK)
         play_frame.pack(side=tk.LEFT)
-        self.play_btn = tk.Button(
-            play_frame, text="▶ PLAY", font=("Consolas", 11, "bold"),
-            bg=PLAY_BG, fg=PLAY_FG, activebackground=ACCENT_DIM, activeforeground=PLAY_FG,
-            relief=tk.FLAT, padx=22, pady=8, cursor="hand2",
+        self.play_btn = ttk.Button(
+            play_frame, text="▶ PLAY", style="Play.TButton", cursor="hand2",
             command=self._toggle_play
         )
         self.play_btn.pack(side=tk.LEFT, padx=4)
-        self.stop_btn = tk.Button(
-            play_frame, text="■ STOP", font=("Consolas", 11, "bold"),
-            bg=STOP_BG, fg=STOP_FG, activebackground=TEXT_DIM, activeforeground=STOP_FG,
-            relief=tk.FLAT, padx=22, pady=8, cursor="hand2",
+        self.stop_btn = ttk.Button(
+            play_frame, text="■ STOP", style="Stop.TButton", cursor="hand2",
             command=self._stop
         )
         self.stop_btn.pack(side=tk.LEFT, padx=4)
-        self.rec_btn = tk.Button(
-            play_frame, text="● REC", font=("Consolas", 10, "bold"),
-            bg=BG_PANEL, fg=TEXT, activebackground=BORDER_ACCENT, activeforeground=BG_DARK,
-            relief=tk.FLAT, padx=16, pady=8, cursor="hand2",
+        self.rec_btn = ttk.Button(
+            play_frame, text="● REC", style="Rec.TButton", cursor="hand2",
             command=self._toggle_record
         )
         self.rec_btn.pack(side=tk.LEFT, padx=4)
         rec_status_frame = tk.Frame(main, bg=BG_DARK)
         rec_status_frame.pack(fill=tk.X)
+        self.rec_status_var = tk.StringVar(value="")
         self.rec_status_label = tk.Label(
-            rec_status_frame, text="", font=("Consolas", 9),
+            rec_status_frame, textvariable=self.rec_status_var, font=("Consolas", 9),
             fg=TEXT_DIM, bg=BG_DARK
         )
         self.rec_status_label.pack(anchor=tk.W)
@@ -277,8 +544,9 @@ class FMRadioApp:
             orient=tk.HORIZONTAL, length=240, command=self._on_volume
         )
         self.vol_scale.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=8)
+        self.vol_text_var = tk.StringVar(value=f"{self._volume}%")
         self.vol_value_label = tk.Label(
-            vol_frame, text="80%", font=("Consolas", 9),
+            vol_frame, textvariable=self.vol_text_var, font=("Consolas", 9),
             fg=ACCENT, bg=BG_DARK, width=4
         )
         self.vol_value_label.pack(side=tk.LEFT)
@@ -291,7 +559,7 @@ class FMRadioApp:
             fg=TEXT_DIM, bg=BG_DARK, width=6, anchor=tk.W
         ).pack(side=tk.LEFT)
         self.search_var = tk.StringVar()
-        self.search_var.trace_add("write", lambda *a: self._on_search())
+        self.search_var.trace_add("write", self._on_search)
         self.search_entry = tk.Entry(
             search_frame, textvariable=self.search_var, font=("Segoe UI", 10),
             bg=BG_DISPLAY, fg=TEXT, insertbackground=TEXT,
@@ -304,16 +572,12 @@ class FMRadioApp:
         list_header = tk.Frame(main, bg=BG_DARK)
         list_header.pack(fill=tk.X, pady=(16, 6))
         tk.Label(list_header, text="STATIONS", font=("Consolas", 9), fg=TEXT_DIM, bg=BG_DARK).pack(side=tk.LEFT)
-        tk.Button(
-            list_header, text="Add", font=("Consolas", 9),
-            bg=BG_PANEL, fg=TEXT_DIM, activebackground=BORDER_ACCENT, activeforeground=BG_DARK,
-            relief=tk.FLAT, padx=10, pady=2, cursor="hand2",
+        ttk.Button(
+            list_header, text="Add", style="Small.TButton", cursor="hand2",
             command=self._add_station
         ).pack(side=tk.RIGHT, padx=(0, 6))
-        tk.Button(
-            list_header, text="Remove", font=("Consolas", 9),
-            bg=BG_PANEL, fg=TEXT_DIM, activebackground=STOP_BG, activeforeground=TEXT,
-            relief=tk.FLAT, padx=10, pady=2, cursor="hand2",
+        ttk.Button(
+            list_header, text="Remove", style="Remove.TButton", cursor="hand2",
             command=self._delete_station
         ).pack(side=tk.RIGHT, padx=(0, 8))
         self.station_count_label = tk.Label(
@@ -321,22 +585,22 @@ class FMRadioApp:
         )
         self.station_count_label.pack(side=tk.RIGHT)
         tk.Frame(list_header, height=1, bg=BORDER).pack(fill=tk.X, pady=(4, 0))
-        list_outer = tk.Frame(main, bg=BORDER, padx=1, pady=1)
-        list_outer.pack(fill=tk.BOTH, expand=True)
-        list_container = tk.Frame(list_outer, bg=BG_PANEL)
+        list_container = tk.Frame(
+            main, bg=BG_PANEL, highlightthickness=1, highlightbackground=BORDER, highlightcolor=BORDER
+        )
         list_container.pack(fill=tk.BOTH, expand=True)
         scrollbar = ttk.Scrollbar(list_container)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.listbox = tk.Listbox(
             list_container, font=("Consolas", 10), height=8,
             bg=BG_DISPLAY, fg=TEXT, selectbackground=BORDER_ACCENT, selectforeground=BG_DARK,
-            activestyle=tk.NONE, relief=tk.FLAT, bd=0,
+            activestyle=tk.NONE, relief=tk.FLAT, bd=0, exportselection=False,
             highlightthickness=0, yscrollcommand=scrollbar.set
         )
         self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.config(command=self.listbox.yview)
         self.listbox.bind("<<ListboxSelect>>", self._on_station_select)
-        self.listbox.bind("<Double-1>", lambda e: self._toggle_play())
+        self.listbox.bind("<Double-1>", self._on_double_click)
         # Bind Up/Down on listbox so they work when listbox has focus (e.g. on Windows)
         self.listbox.bind("<Up>", self._on_up_key)
         self.listbox.bind("<Down>", self._on_down_key)
@@ -345,8 +609,10 @@ class FMRadioApp:
         self._fill_listbox()
 
     def _apply_styles(self):
-        style = ttk.Style()
-        style.theme_use("clam")
+        style = ttk.Style(self.root)
+        # Switching themes rebuilds every ttk element; skip it when clam is already active
+        if style.theme_use() != "clam":
+            style.theme_use("clam")
         style.configure(
             "Horizontal.TScale",
             background=BG_DARK,
@@ -355,57 +621,168 @@ class FMRadioApp:
             lightcolor=ACCENT,
         )
         style.map("Horizontal.TScale", background=[("active", ACCENT)])
+        # Flat buttons share one definition per role; the REC button swaps style instead of colours
+        for name, font, padding, bg, fg, active_bg, active_fg in (
+            ("Nav.TButton", ("Consolas", 10, "bold"), (14, 8), BG_PANEL, TEXT, BORDER_ACCENT, BG_DARK),
+            ("Play.TButton", ("Consolas", 11, "bold"), (22, 8), PLAY_BG, PLAY_FG, ACCENT_DIM, PLAY_FG),
+            ("Stop.TButton", ("Consolas", 11, "bold"), (22, 8), STOP_BG, STOP_FG, TEXT_DIM, STOP_FG),
+            ("Rec.TButton", ("Consolas", 10, "bold"), (16, 8), BG_PANEL, TEXT, BORDER_ACCENT, BG_DARK),
+            ("RecOn.TButton", ("Consolas", 10, "bold"), (16, 8), STOP_BG, STOP_FG, TEXT_DIM, STOP_FG),
+            ("Small.TButton", ("Consolas", 9), (10, 2), BG_PANEL, TEXT_DIM, BORDER_ACCENT, BG_DARK),
+            ("Remove.TButton", ("Consolas", 9), (10, 2), BG_PANEL, TEXT_DIM, STOP_BG, TEXT),
+        ):
+            style.configure(
+                name, font=font, padding=padding, background=bg, foreground=fg,
+                relief=tk.FLAT, borderwidth=0, bordercolor=bg, lightcolor=bg, darkcolor=bg, focuscolor=bg,
+            )
+            style.map(
+                name,
+                background=[("pressed", active_bg), ("active", active_bg)],
+                foreground=[("pressed", active_fg), ("active", active_fg)],
+                lightcolor=[("pressed", active_bg), ("active", active_bg)],
+                darkcolor=[("pressed", active_bg), ("active", active_bg)],
+            )
         try:
             style.configure("Vertical.TScrollbar", background=BG_PANEL, troughcolor=BG_DARK)
         except tk.TclError:
             pass
 
-    def _on_search(self):
-        self._fill_listbox()
+    def _on_search(self, *args):
+        # Debounce: a burst of keystrokes triggers a single listbox rebuild once typing pauses
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(120, self._fill_listbox)
         # Do not change current_index or update Now Playing when typing in search—
         # the display should only reflect the station that is actually selected/playing.
 
+    def _rebuild_columns(self):
+        """Refresh the per-field column lists from self.stations (call after add/remove/edit)."""
+        self.col_blobs = [s["_search_blob"] for s in self.stations]
+        self.col_rows = [s["_row"] for s in self.stations]
+        self._displayed_indices = None  # indices shifted; rows on screen can't be diffed
+
     def _fill_listbox(self):
+        # A direct rebuild supersedes any pending debounced one
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        if not self.stations:
+            # Nothing to filter or select: clear whatever is shown and stop there
+            self.filtered_indices = []
+            self._filtered_pos = {}
+            self.listbox.delete(0, tk.END)
+            self._displayed_indices = []
+            self._last_listbox_sel = None
+            if not self._destroyed:
+                self.station_count_label.config(text="0 stations")
+            return
         q = (getattr(self, "search_var", None) and self.search_var.get() or "").strip().lower()
         if not q:
             self.filtered_indices = list(range(len(self.stations)))
         else:
-            def matches(s):
-                if q in (s.get("name") or "").lower() or q in str(s.get("frequency", "")):
-                    return True
-                if q in (s.get("genre") or "").lower() or q in (s.get("description") or "").lower():
-                    return True
-                for tag in s.get("tags") or []:
-                    if q in (tag or "").lower():
-                        return True
-                loc = s.get("location") or {}
-                if isinstance(loc, dict):
-                    if q in (loc.get("city") or "").lower() or q in (loc.get("state") or "").lower():
-                        return True
-                return False
-            self.filtered_indices = [i for i, s in enumerate(self.stations) if matches(s)]
+            # Blobs are precomputed by index_station, so each test is a single substring check
+            self.filtered_indices = [i for i, b in enumerate(self.col_blobs) if q in b]
+        self._filtered_pos = {idx: pos for pos, idx in enumerate(self.filtered_indices)}
         # Ignore selection events while rebuilding (they can fire with wrong index, e.g. 0)
         self._filling_listbox = True
         try:
-            self.listbox.delete(0, tk.END)
-            for idx in self.filtered_indices:
-                s = self.stations[idx]
-                self.listbox.insert(tk.END, f"  {s.get('frequency', '??')}  {s.get('name', 'Unknown')}")
-            if self.filtered_indices and self.current_index in self.filtered_indices:
-                listbox_idx = self.filtered_indices.index(self.current_index)
-                self.listbox.selection_set(listbox_idx)
-                self.listbox.see(listbox_idx)
+            # All mutations happen before returning to the event loop and see() runs once at
+            # the end, so Tk repaints the list a single time at idle. Don't add update() or
+            # update_idletasks() here: that would force a synchronous intermediate redraw.
+            self._sync_listbox_rows()
+            self._refresh_selection(force=True)
         finally:
             self._filling_listbox = False
         n = len(self.stations)
-        if hasattr(self, "station_count_label") and self.station_count_label.winfo_exists():
+        if not self._destroyed:
             self.station_count_label.config(text=f"{n} station{'s' if n != 1 else ''}")
 
+    def _sync_listbox_rows(self):
+        """Bring the listbox rows in line with filtered_indices, touching only rows that changed.
+
+        Both lists are ascending station indices, so one merge walk finds the runs to delete
+        and insert; narrowing a search issues just a few deletes instead of a full refill.
+        """
+        old = self._displayed_indices
+        new = self.filtered_indices
+        col_rows = self.col_rows
+        # Local aliases: the walk below runs once per visible row on every search keystroke
+        delete = self.listbox.delete
+        insert = self.listbox.insert
+        if old is None:
+            delete(0, tk.END)
+            old = []
+        n_old = len(old)
+        n_new = len(new)
+        i = j = pos = 0
+        while i < n_old or j < n_new:
+            if i < n_old and j < n_new and old[i] == new[j]:
+                i += 1
+                j += 1
+                pos += 1
+            elif j >= n_new or (i < n_old and old[i] < new[j]):
+                start = i
+                while i < n_old and (j >= n_new or old[i] < new[j]):
+                    i += 1
+                delete(pos, pos + i - start - 1)
+            else:
+                start = j
+                while j < n_new and (i >= n_old or new[j] < old[i]):
+                    j += 1
+                # One variadic insert = one Tcl call for the whole run
+                insert(pos, *[col_rows[k] for k in new[start:j]])
+                pos += j - start
+        self._displayed_indices = list(new)
+
     def _update_display(self):
-        if not self.stations or self.current_index < 0 or self.current_index >= len(self.stations):
+        if not self.stations:
+            return
+        s = self._get_station()
+        if s is None:
+            return
+        entry = self._display_cache.get(id(s))
+        if entry is None:
+            entry = self._display_cache[id(s)] = self._format_display(s)
+        freq, now_text, display_text = entry
+        self._set_text(self.freq_var, freq)
+        self._set_text(self.now_playing_var, now_text or " ")
+        self._set_text(self.station_var, display_text)
+        # Only sync listbox selection; don't rebuild the list (avoids flicker/rearrange on click)
+        self._refresh_selection()
+
+    def _refresh_selection(self, force=False):
+        """Select and scroll to the current station's row; skipped if that row is already selected."""
+        if not self.stations:
+            return
+        listbox_idx = self._filtered_pos.get(self.current_index)
+        if listbox_idx == self._last_listbox_sel and not force:
             return
-        s = self.stations[self.current_index]
-        self.freq_label.config(text=s.get("frequency", "—"))
+        self.listbox.selection_clear(0, tk.END)
+        if listbox_idx is not None:
+            self.listbox.selection_set(listbox_idx)
+            self.listbox.see(listbox_idx)
+        self._last_listbox_sel = listbox_idx
+
+    def _configure(self, widget, **options):
+        """widget.config(**options), sending only options that differ from what was last applied.
+
+        Use this for every update of a widget routed through it, or the cache goes stale.
+        """
+        last = self._widget_opts.setdefault(widget, {})
+        changed = {k: v for k, v in options.items() if last.get(k) != v}
+        if changed:
+            last.update(changed)
+            widget.config(**changed)
+
+    def _set_text(self, var, text):
+        """var.set(text) unless it already holds text; one Tcl "set", and no label relayout if unchanged."""
+        key = str(var)
+        if self._var_text.get(key) != text:
+            self._var_text[key] = text
+            var.set(text)
+
+    def _format_display(self, s):
+        """Build the (frequency, now playing, station line) texts shown for a station."""
         # Now Playing from station metadata (title, artist, show)
         np = s.get("nowPlaying")
         if np and isinstance(np, dict):
@@ -426,7 +803,6 @@ class FMRadioApp:
         max_np_len = 52
         if len(now_text) > max_np_len:
             now_text = now_text[: max_np_len - 1].rstrip() + "…"
-        self.now_playing_label.config(text=now_text or " ")
         # Station name + genre/bitrate/description — single line, no wrap (fixed height)
         name = s.get("name", "—")
         genre = (s.get("genre") or "").strip()
@@ -443,44 +819,64 @@ class FMRadioApp:
         max_station_len = 56
         if len(display_text) > max_station_len:
             display_text = display_text[: max_station_len - 1].rstrip() + "…"
-        self.station_label.config(text=display_text)
-        # Only sync listbox selection; don't rebuild the list (avoids flicker/rearrange on click)
-        if self.listbox.size() == len(self.filtered_indices) and self.current_index in self.filtered_indices:
-            self.listbox.selection_clear(0, tk.END)
-            listbox_idx = self.filtered_indices.index(self.current_index)
-            self.listbox.selection_set(listbox_idx)
-            self.listbox.see(listbox_idx)
-        else:
-            self._fill_listbox()
+        return s.get("frequency", "—"), now_text, display_text
 
     def _get_station(self):
-        if not self.stations or self.current_index < 0 or self.current_index >= len(self.stations):
+        # current_index is never negative, so IndexError is the only out-of-range case
+        try:
+            return self.stations[self.current_index]
+        except IndexError:
             return None
-        return self.stations[self.current_index]
 
     def _toggle_play(self):
-        if not self.player or not self.stations:
+        if not self.stations:
             return
-        if self.player.is_playing():
-            self.player.pause()
+        if self._is_playing:
+            self._vlc_call(self.player.pause)
+            self._is_playing = False
             self.play_btn.config(text="▶ PLAY")
         else:
-            station = self._get_station()
-            if not station:
-                return
-            url = station.get("url")
-            if not url:
-                messagebox.showwarning("No URL", "This station has no stream URL.")
-                return
-            media = self.instance.media_new(url)
-            self.player.set_media(media)
-            self.player.audio_set_volume(self._volume)
+            self._play_current_station()
+
+    def _play_url(self, url):
+        """Switch the player to url and start it in one step (no pause/resume round trip)."""
+        volume = self._volume
+        self._play_gen += 1
+        gen = self._play_gen
+
+        def switch():
+            self.player.set_media(self._media_for(url))
+            self._loaded_gen = gen
+            self.player.audio_set_volume(volume)
             self.player.play()
-            self.play_btn.config(text="⏸ PAUSE")
+
+        self._vlc_call(switch)
+        self._is_playing = True
+        self.play_btn.config(text="⏸ PAUSE")
+
+    def _media_for(self, url):
+        """Return a cached vlc.Media for url, creating it on first use (LRU-bounded; VLC thread)."""
+        media = self._media_cache.get(url)
+        if media is None:
+            media = self._media_cache[url] = self.instance.media_new(url)
+            if len(self._media_cache) > MEDIA_CACHE_SIZE:
+                self._media_cache.popitem(last=False)[1].release()
+        else:
+            self._media_cache.move_to_end(url)
+        return media
+
+    def _release_media(self, url=None):
+        """Drop cached media for url (or all of it) and release the libVLC handles (VLC thread)."""
+        urls = [url] if url is not None else list(self._media_cache)
+        for u in urls:
+            media = self._media_cache.pop(u, None)
+            if media is not None:
+                media.release()
 
     def _stop(self):
         if self.player:
-            self.player.stop()
+            self._vlc_call(self.player.stop)
+            self._is_playing = False
             self.play_btn.config(text="▶ PLAY")
 
     def _record_worker(self, url: str, path: Path):
@@ -488,52 +884,79 @@ class FMRadioApp:
         try:
             req = Request(url, headers={"User-Agent": "FM-Radio-Recorder/1.0"})
             with urlopen(req, timeout=15) as resp:
-                try:
-                    if hasattr(resp, "fp") and getattr(resp.fp, "raw", None) is not None:
-                        resp.fp.raw.sock.settimeout(10.0)
-                except (AttributeError, OSError):
-                    pass
+                # http.client reads through a SocketIO wrapper; its socket lives in ._sock
+                sock = getattr(getattr(getattr(resp, "fp", None), "raw", None), "_sock", None)
+                if sock is not None:
+                    try:
+                        sock.settimeout(10.0)
+                    except OSError:
+                        pass
+                self._recording_sock = sock
+                # One preallocated buffer for the whole recording: no per-chunk bytes objects
+                buf = bytearray(RECORD_CHUNK_SIZE)
+                view = memoryview(buf)
+                readinto = getattr(resp, "readinto", None)
+                if readinto is None:
+                    # Non-HTTP handlers may return objects with only read()
+                    def readinto(b):
+                        chunk = resp.read(len(b))
+                        b[:len(chunk)] = chunk
+                        return len(chunk)
                 with open(path, "wb") as f:
                     while not self._recording_stop.is_set():
                         try:
-                            chunk = resp.read(RECORD_CHUNK_SIZE)
-                            if not chunk:
+                            n = readinto(buf)
+                            if not n:
                                 break
-                            f.write(chunk)
-                        except (OSError, ConnectionError, TimeoutError):
+                            f.write(view[:n])
+                        except http.client.IncompleteRead as e:
+                            # A stop shut down a chunked stream mid-read: keep what arrived
+                            f.write(e.partial)
+                            break
+                        except (OSError, http.client.HTTPException):
                             break
         except Exception as e:
-            if self._recording and self.rec_status_label.winfo_exists():
+            # Anything raised after a stop request is just the interrupted read: keep the file
+            if self._recording and not self._recording_stop.is_set() and not self._destroyed:
                 self._recording_path = None
                 try:
                     path.unlink(missing_ok=True)
                 except OSError:
                     pass
-                self.root.after(0, lambda: self._show_recording_error(str(e)))
+                msg = str(e)  # e is unbound once the except block ends
+                self.root.after(0, lambda: self._show_recording_error(msg))
         finally:
-            self.root.after(0, self._on_recording_finished)
+            self._recording_sock = None
+            if not self._destroyed:
+                self.root.after(0, self._on_recording_finished)
 
     def _show_recording_error(self, msg: str):
-        messagebox.showerror("Recording error", f"Recording failed.\n\n{msg}")
+        if self._destroyed:
+            return
+        _msg("showerror", "Recording error", f"Recording failed.\n\n{msg}")
         self._recording = False
         self._update_recording_ui()
 
     def _on_recording_finished(self):
+        if self._destroyed:
+            return
         self._recording = False
         self._recording_thread = None
         self._update_recording_ui()
         if self._recording_path and self._recording_path.exists() and self._recording_path.stat().st_size > 0:
-            messagebox.showinfo("Recording saved", f"Saved to:\n{self._recording_path}")
+            _msg("showinfo", "Recording saved", f"Saved to:\n{self._recording_path}")
 
     def _update_recording_ui(self):
-        if not hasattr(self, "rec_btn") or not self.rec_btn.winfo_exists():
+        if self._destroyed:
             return
         if self._recording:
-            self.rec_btn.config(text="■ STOP REC", bg=STOP_BG, fg=STOP_FG)
-            self.rec_status_label.config(text=f"Recording: {self._recording_path.name if self._recording_path else '…'}", fg=ACCENT)
+            self._configure(self.rec_btn, text="■ STOP REC", style="RecOn.TButton")
+            self._set_text(self.rec_status_var, f"Recording: {self._recording_path.name if self._recording_path else '…'}")
+            self._configure(self.rec_status_label, fg=ACCENT)
         else:
-            self.rec_btn.config(text="● REC", bg=BG_PANEL, fg=TEXT)
-            self.rec_status_label.config(text="", fg=TEXT_DIM)
+            self._configure(self.rec_btn, text="● REC", style="Rec.TButton")
+            self._set_text(self.rec_status_var, "")
+            self._configure(self.rec_status_label, fg=TEXT_DIM)
 
     def _toggle_record(self):
         if self._recording:
@@ -541,16 +964,19 @@ class FMRadioApp:
             return
         station = self._get_station()
         if not station:
-            messagebox.showwarning("No station", "Select a station first.")
+            _msg("showwarning", "No station", "Select a station first.")
             return
         url = station.get("url")
         if not url:
-            messagebox.showwarning("No URL", "This station has no stream URL.")
+            _msg("showwarning", "No URL", "This station has no stream URL.")
             return
-        safe_name = "".join(c if c.isalnum() or c in " .-_" else "_" for c in station.get("name", "station"))[:40]
-        ext = ".mp3" if "mp3" in url.lower() or "mpeg" in url.lower() else ".aac" if "aac" in url.lower() else ".mp3"
+        # The table covers Latin-1 only, so fold anything else to "?" first (then mapped to "_")
+        name = station.get("name", "station").encode("ascii", "replace").decode("ascii")
+        safe_name = name.translate(_SANITIZE_TABLE)[:40].strip()
+        url_lower = url.lower()
+        ext = ".mp3" if "mp3" in url_lower or "mpeg" in url_lower else ".aac" if "aac" in url_lower else ".mp3"
         stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        self._recording_path = RECORDINGS_DIR / f"record_{stamp}_{safe_name.strip()}{ext}"
+        self._recording_path = RECORDINGS_DIR / f"record_{stamp}_{safe_name}{ext}"
         self._recording_stop.clear()
         self._recording = True
         self._recording_thread = threading.Thread(
@@ -563,17 +989,34 @@ class FMRadioApp:
 
     def _stop_recording(self):
         self._recording_stop.set()
+        # Unblock a read stuck on a stalled server; the interrupted read (an OSError, or
+        # IncompleteRead on a chunked stream) ends the worker's loop and the file is kept
+        sock = self._recording_sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
         self._update_recording_ui()
 
     def _on_volume(self, value):
         try:
-            v = int(float(value))
-            self._volume = max(0, min(100, v))
-            self.vol_value_label.config(text=f"{self._volume}%")
-            if self.player:
-                self.player.audio_set_volume(self._volume)
+            v = max(0, min(100, int(float(value))))
         except (ValueError, TypeError):
-            pass
+            return
+        # The label follows the drag; libVLC only gets the latest value, once per idle cycle
+        self._volume = v
+        self._set_text(self.vol_text_var, f"{v}%")
+        if self._vol_after_id is None:
+            self._vol_after_id = self.root.after_idle(self._flush_volume)
+
+    def _flush_volume(self):
+        self._vol_after_id = None
+        volume = self._volume
+        if volume == self._applied_volume or not self.player:
+            return
+        self._applied_volume = volume
+        self._vlc_call(lambda: self.player.audio_set_volume(volume))
 
     def _on_up_key(self, event=None):
         self._prev_station()
@@ -591,62 +1034,63 @@ class FMRadioApp:
         self._next_station()
         return "break"
 
+    def _on_double_click(self, event=None):
+        # The first click's selection already queued a play; toggling here would pause it again
+        self._play_current_station()
+
     def _on_enter_key(self, event=None):
         self._play_current_station()
         return "break"
 
     def _play_current_station(self):
         """Start or restart playback of the currently selected station."""
-        if not self.player or not self.stations:
+        if not self.stations:
             return
-        if self.player.is_playing():
-            self._toggle_play()
-            self._toggle_play()
-        else:
-            self._toggle_play()
+        station = self._get_station()
+        if not station:
+            return
+        url = station.get("url")
+        if not url:
+            _msg("showwarning", "No URL", "This station has no stream URL.")
+            return
+        if self._ensure_player():
+            self._play_url(url)
 
     def _prev_station(self):
         if not self.filtered_indices:
             return
-        was_playing = self.player and self.player.is_playing()
-        pos = self.filtered_indices.index(self.current_index) if self.current_index in self.filtered_indices else 0
+        was_playing = self._is_playing
+        pos = self._filtered_pos.get(self.current_index, 0)
         new_pos = (pos - 1) % len(self.filtered_indices)
         self.current_index = self.filtered_indices[new_pos]
         self._update_display()
         if was_playing:
-            self._toggle_play()
-            self._toggle_play()
+            self._play_current_station()
 
     def _next_station(self):
         if not self.filtered_indices:
             return
-        was_playing = self.player and self.player.is_playing()
-        pos = self.filtered_indices.index(self.current_index) if self.current_index in self.filtered_indices else 0
+        was_playing = self._is_playing
+        pos = self._filtered_pos.get(self.current_index, 0)
         new_pos = (pos + 1) % len(self.filtered_indices)
         self.current_index = self.filtered_indices[new_pos]
         self._update_display()
         if was_playing:
-            self._toggle_play()
-            self._toggle_play()
+            self._play_current_station()
 
     def _random_station(self):
         """Pick a random station and start playing it."""
         if not self.filtered_indices:
             return
         n = len(self.filtered_indices)
-        if n == 1:
-            idx = self.filtered_indices[0]
-        else:
-            candidates = [i for i in self.filtered_indices if i != self.current_index]
-            idx = random.choice(candidates) if candidates else self.filtered_indices[0]
+        # Rejection sampling: at most one entry equals current_index, so this is O(1) expected
+        idx = self.filtered_indices[random.randrange(n)]
+        while idx == self.current_index and n > 1:
+            idx = self.filtered_indices[random.randrange(n)]
         self.current_index = idx
         self._update_display()
         # Start playing (or restart if already playing)
-        if self.player and self.player.is_playing():
-            self._toggle_play()
-            self._toggle_play()
-        else:
-            self._toggle_play()
+        self._play_current_station()
 
     def _on_station_select(self, event):
         # Ignore selection events fired during search/listbox rebuild (they use wrong index)
@@ -668,6 +1112,13 @@ class FMRadioApp:
 
     def _add_station(self):
         """Open a dialog to add a new station (name, URL, frequency) and save."""
+        # Saving before the list is loaded would overwrite stations.json with an empty list
+        if self._stations_error is not None:
+            _msg("showwarning", "Add station", f"{STATIONS_FILE.name} could not be read:\n\n{self._stations_error}")
+            return
+        if not self._stations_loaded:
+            _msg("showinfo", "Add station", "Stations are still loading, try again in a moment.")
+            return
         dialog = tk.Toplevel(self.root)
         dialog.title("Add station")
         dialog.configure(bg=BG_DARK)
@@ -699,22 +1150,28 @@ class FMRadioApp:
             url = url_entry.get().strip()
             freq = freq_entry.get().strip() or "—"
             if not name:
-                messagebox.showwarning("Add station", "Please enter a station name.", parent=dialog)
+                _msg("showwarning", "Add station", "Please enter a station name.", parent=dialog)
                 return
             if not url:
-                messagebox.showwarning("Add station", "Please enter a stream URL.", parent=dialog)
+                _msg("showwarning", "Add station", "Please enter a stream URL.", parent=dialog)
                 return
             if not url.startswith(("http://", "https://")):
-                messagebox.showwarning("Add station", "URL must start with http:// or https://", parent=dialog)
+                _msg("showwarning", "Add station", "URL must start with http:// or https://", parent=dialog)
                 return
             result["ok"] = True
-            new_station = {"name": name, "url": url, "frequency": freq, **default_station_metadata()}
+            new_station = {"name": name, "url": url, "frequency": freq, **_DEFAULTS}
             new_station["dialPosition"] = len(self.stations) + 1
+            index_station(new_station)
+            self._display_cache.pop(id(new_station), None)
             self.stations.append(new_station)
-            save_stations(self.stations)
+            # Existing indices don't shift on append, so extend the columns in place and let
+            # _fill_listbox diff in just the new row instead of refilling the whole list
+            self.col_blobs.append(new_station["_search_blob"])
+            self.col_rows.append(new_station["_row"])
+            self._schedule_save()
             self.current_index = len(self.stations) - 1
-            self._update_display()
             self._fill_listbox()
+            self._update_display()
             dialog.destroy()
 
         def on_cancel():
@@ -751,32 +1208,62 @@ class FMRadioApp:
         if idx < 0 or idx >= len(self.stations):
             return
         name = self.stations[idx].get("name", "Unknown")
-        if not messagebox.askyesno("Remove station", f"Remove \"{name}\" from the list?"):
+        if not _msg("askyesno", "Remove station", f"Remove \"{name}\" from the list?"):
             return
-        was_playing = self.player and self.player.is_playing()
+        was_playing = self._is_playing
         if was_playing:
-            self.player.stop()
+            self._vlc_call(self.player.stop)
+            self._is_playing = False
             self.play_btn.config(text="▶ PLAY")
-        self.stations.pop(idx)
-        save_stations(self.stations)
+        removed = self.stations.pop(idx)
+        self._display_cache.pop(id(removed), None)
+        url = removed.get("url")
+        if url and self.player:
+            # The media cache belongs to the VLC thread
+            self._vlc_call(lambda: self._release_media(url))
+        del self.col_blobs[idx]
+        del self.col_rows[idx]
+        # Remove just this row and renumber the shown indices, so _fill_listbox has nothing to redo
+        shown = self._displayed_indices
+        if shown is not None:
+            pos = bisect.bisect_left(shown, idx)
+            if pos < len(shown) and shown[pos] == idx:
+                self.listbox.delete(pos)
+                del shown[pos]
+            self._displayed_indices = shown[:pos] + [i - 1 for i in shown[pos:]]
+        self._schedule_save()
+        self.current_index = min(idx, len(self.stations) - 1) if self.stations else 0
+        self._fill_listbox()
         if not self.stations:
-            self.current_index = 0
-            self.freq_label.config(text="—")
-            self.station_label.config(text="— No station —")
-            if hasattr(self, "now_playing_label") and self.now_playing_label.winfo_exists():
-                self.now_playing_label.config(text="")
+            self._set_text(self.freq_var, "—")
+            self._set_text(self.station_var, "— No station —")
+            self._set_text(self.now_playing_var, "")
         else:
-            self.current_index = min(idx, len(self.stations) - 1)
             self._update_display()
-        self._fill_listbox()
 
     def _on_closing(self):
         if self.player:
-            self.player.stop()
+            self._vlc_call(self.player.stop)
+            self._vlc_call(self._release_media)
+        if self._vlc_thread is not None:
+            # Let queued calls (including the stop) finish before tearing down
+            self._vlc_queue.put(None)
+            self._vlc_thread.join(timeout=2)
+        if self._save_thread is not None:
+            # Make sure the last add/remove reaches disk before the process exits. The queue may
+            # still hold that snapshot (or the writer may be dead), so bound the whole wait at 5 s.
+            deadline = time.monotonic() + 5
+            try:
+                self._save_queue.put(None, timeout=5)
+            except queue.Full:
+                pass  # writer never took the pending snapshot; close anyway
+            else:
+                self._save_thread.join(timeout=max(0, deadline - time.monotonic()))
+        self._destroyed = True
         self.root.destroy()
 
     def run(self):
-        if self.player is None and vlc is not None:
+        if self._destroyed:
             return
         self.root.mainloop()
 